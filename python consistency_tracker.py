@@ -1,13 +1,142 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+import tkinter.font as tkfont
+from tkinter import ttk
+import atexit
 import json
 import os
+import queue
+import re
+import sys
+import threading
+import traceback
 from datetime import datetime, date, timedelta
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 from collections import defaultdict
 import calendar
+import functools
+import itertools
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+EMPTY = frozenset()
+
+# Colors offered for categories
+PALETTE = ('#667eea', '#48bb78', '#f56565', '#ed8936', '#9f7aea')
+
+# Accepted format of dates entered in the log dialog, ASCII digits only
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+# Earliest year accepted for a log; the latest is next year
+MIN_LOG_YEAR = 1900
+
+# Most minutes a single log entry can record
+MAX_LOG_MINUTES = 1440
+
+# Delay before edits are written to disk, so bursts share one save
+SAVE_DELAY_MS = 5000
+
+# Compact the log file once dead lines exceed this share of live logs
+COMPACT_RATIO = 0.5
+
+# Calendar geometry: day cell size and height of the weekday header
+CAL_CELL_W = 80
+CAL_CELL_H = 60
+CAL_HEADER_H = 24
+
+# Packed log record: day ordinal, category position, minutes
+LOG_DTYPE = np.dtype([('d', 'i4'), ('c', 'i2'), ('m', 'i4')])
+
+@functools.lru_cache(maxsize=None)
+def _days_in_month(year, month):
+    """Number of days in a month, memoized"""
+    return calendar.monthrange(year, month)[1]
+
+def _dumps(data, pretty=False):
+    """Serialize data to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def _loads(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _parse_log(record):
+    """Attach the parsed date to a loaded log, False if it is malformed"""
+    try:
+        record['_date'] = date.fromisoformat(record['date'])
+    except (KeyError, TypeError, ValueError):
+        return False
+    # Minutes are packed as int32 in the log arrays; bools are not minutes
+    minutes = record.get('minutes')
+    return (type(minutes) is int and 0 < minutes < 2**31
+            and isinstance(record.get('category_id'), (str, int)))
+
+def _valid_category(record):
+    """Whether a loaded category has the fields the views rely on"""
+    return (isinstance(record, dict)
+            and isinstance(record.get('id'), (str, int))
+            and isinstance(record.get('name'), str)
+            and isinstance(record.get('goal'), int)
+            and isinstance(record.get('color'), str))
+
+def _insert_sorted(values, value):
+    """Return a sorted array with value added, unchanged if present"""
+    i = np.searchsorted(values, value)
+    if i < values.size and values[i] == value:
+        return values
+    return np.insert(values, i, value)
+
+def _stored(record):
+    """Copy of a record without its runtime-only underscore fields"""
+    return {k: v for k, v in record.items() if not k.startswith('_')}
+
+# Display sections in redraw order
+REFRESH_SECTIONS = ('stats', 'today', 'weekly', 'categories', 'calendar', 'analytics')
+
+# Notebook tabs in display order and the sections drawn on each
+TABS = ('dashboard', 'categories', 'calendar', 'analytics')
+SECTION_TABS = {
+    'today': 'dashboard',
+    'weekly': 'dashboard',
+    'categories': 'categories',
+    'calendar': 'calendar',
+    'analytics': 'analytics'
+}
+
+def _streaks(logged_days, full_days, today_ord, month_start, month_end):
+    """Sweep the sorted ordinals of logged and fully completed days
+    
+    Returns (current streak, longest streak, completed days in the month
+    range [month_start, month_end)). A day counts toward the current streak
+    and the month when every category was logged, and toward the longest
+    streak when anything was logged. Work grows with the number of distinct
+    logged days, not with the span of dates they cover.
+    """
+    # Complete days running back from today without a gap
+    end = int(np.searchsorted(full_days, today_ord, side='right'))
+    recent = full_days[end - 1::-1] if end else full_days[:0]
+    gaps = np.flatnonzero(recent != today_ord - np.arange(end))
+    current = int(gaps[0]) if gaps.size else end
+    
+    longest = 0
+    if logged_days.size:
+        breaks = np.flatnonzero(np.diff(logged_days) != 1)
+        bounds = np.concatenate(([-1], breaks, [logged_days.size - 1]))
+        longest = int(np.diff(bounds).max())
+        
+    completed = int(np.searchsorted(full_days, month_end) - np.searchsorted(full_days, month_start))
+    return current, longest, completed
 
 class ConsistencyTracker:
     def __init__(self, root):
@@ -15,21 +144,65 @@ class ConsistencyTracker:
         self.root.title("Consistency Tracker - Daily Progress Hub")
         self.root.geometry("1200x700")
         
-        # Data storage
+        # Screen size is fixed for the session, query it once for dialogs
+        self._screen_width = self.root.winfo_screenwidth()
+        self._screen_height = self.root.winfo_screenheight()
+        
+        # Saves are written to disk by a background thread
+        self._save_queue = queue.Queue()
+        self._write_errors = 0
+        # Value of _write_errors when everything was last known to be saved
+        self._saved_errors = 0
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+        
+        # Data storage: categories are rewritten on change, logs appended
+        self.categories_file = "categories.json"
+        self.logs_file = "logs.jsonl"
+        # Single-file store of earlier versions, migrated on first load
         self.data_file = "consistency_data.json"
-        self.categories = []
+        self.categories = {}
         self.logs = []
         self.load_data()
         
+        # Edits are batched into delayed saves, flushed on close and exit
+        self._dirty = False
+        self._flush_job = None
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        atexit.register(self._flush, wait=True, compact=True)
+        
+        # Refresh scheduling
+        self._refresh_pending = False
+        self._pending_sections = set()
+        self._indices_stale = True
+        self._dirty_sections = set()
+        self._today = None
+        
+        # Categories whose per-category widgets are outdated, None for all
+        self._stale_rows = {'today': None, 'categories': None}
+        
+        # Monotonic id source, unique even for entries saved in the same second
+        self._id_counter = itertools.count(self._first_free_id())
+        
+        # Dialogs are built on first use and then reused
+        self._category_dialog = None
+        self._log_dialog = None
+        
         # Setup UI
         self.setup_styles()
         self.create_widgets()
-        self.refresh_display()
+        
+        # Paint the stats and today's progress right away and stagger the
+        # heavier sections so a large history doesn't hold up the window
+        self._do_refresh({'stats', 'today'})
+        for delay, section in ((50, 'weekly'), (100, 'categories'),
+                               (150, 'calendar'), (200, 'analytics')):
+            self.root.after(delay, self.refresh_display, {section})
         
     def setup_styles(self):
         """Configure ttk styles"""
-        style = ttk.Style()
-        style.theme_use('clam')
+        self.style = ttk.Style()
+        self.style.theme_use('clam')
+        self._bar_styles = set()
         
         # Configure colors
         self.bg_color = '#f0f2f6'
@@ -38,9 +211,46 @@ class ConsistencyTracker:
         self.success_color = '#48bb78'
         self.warning_color = '#f56565'
         self.text_color = '#2d3748'
-        
+        self.track_color = '#e2e8f0'
+        self.empty_day_color = '#f7fafc'
+        
+        # Fonts are registered with Tk once and shared by all widgets
+        self.F_TITLE = tkfont.Font(family='Helvetica', size=24, weight='bold')
+        self.F_VALUE = tkfont.Font(family='Helvetica', size=20, weight='bold')
+        self.F_HEADER = tkfont.Font(family='Helvetica', size=12)
+        self.F_HEADER_BOLD = tkfont.Font(family='Helvetica', size=12, weight='bold')
+        self.F_SUBTITLE = tkfont.Font(family='Helvetica', size=11, weight='bold')
+        self.F_BODY = tkfont.Font(family='Helvetica', size=10)
+        self.F_BODY_BOLD = tkfont.Font(family='Helvetica', size=10, weight='bold')
+        self.F_SMALL = tkfont.Font(family='Helvetica', size=9)
+        self.F_SMALL_BOLD = tkfont.Font(family='Helvetica', size=9, weight='bold')
+        
+        # Color picker swatches, one radio button style per palette color
+        self.swatch_styles = {}
+        for color in PALETTE:
+            name = f"Swatch{color[1:]}.TRadiobutton"
+            self.style.configure(name, background=color, padding=6)
+            self.style.map(name, background=[('active', color)])
+            self.swatch_styles[color] = name
+            
         self.root.configure(bg=self.bg_color)
         
+    def bar_style(self, color, trough, thickness):
+        """Return a flat progress bar style, registering it on first use"""
+        name = f"Bar{color[1:]}{trough[1:]}{thickness}.Horizontal.TProgressbar"
+        if name not in self._bar_styles:
+            self.style.configure(
+                name,
+                background=color,
+                lightcolor=color,
+                darkcolor=color,
+                troughcolor=trough,
+                bordercolor=trough,
+                thickness=thickness
+            )
+            self._bar_styles.add(name)
+        return name
+        
     def create_widgets(self):
         """Create all UI elements"""
         # Main container
@@ -65,7 +275,7 @@ class ConsistencyTracker:
         title_label = ttk.Label(
             header_frame, 
             text="📊 Consistency Tracker", 
-            font=('Helvetica', 24, 'bold'),
+            font=self.F_TITLE,
             foreground=self.primary_color
         )
         title_label.pack(side=tk.LEFT)
@@ -83,7 +293,7 @@ class ConsistencyTracker:
         self.date_label = ttk.Label(
             header_frame,
             text=datetime.now().strftime("%A, %B %d, %Y"),
-            font=('Helvetica', 12),
+            font=self.F_HEADER,
             foreground=self.text_color
         )
         self.date_label.pack(side=tk.RIGHT, pady=10)
@@ -124,7 +334,7 @@ class ConsistencyTracker:
         ttk.Label(
             card,
             text=f"{emoji} {title}",
-            font=('Helvetica', 10),
+            font=self.F_BODY,
             foreground=self.text_color
         ).pack(pady=(10, 5))
         
@@ -132,7 +342,7 @@ class ConsistencyTracker:
         ttk.Label(
             card,
             textvariable=value_var,
-            font=('Helvetica', 20, 'bold'),
+            font=self.F_VALUE,
             foreground=self.primary_color
         ).pack(pady=(0, 10))
         
@@ -147,6 +357,9 @@ class ConsistencyTracker:
         self.create_calendar_tab()
         self.create_analytics_tab()
         
+        # Hidden tabs are redrawn when they are selected
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
     def create_dashboard_tab(self):
         """Create dashboard tab with today's progress"""
         dashboard = ttk.Frame(self.notebook)
@@ -188,6 +401,12 @@ class ConsistencyTracker:
         
         # Store reference for updating
         self.today_frame = scrollable_frame
+        self._today_rows = {}
+        self._today_empty = ttk.Label(
+            scrollable_frame,
+            text="No categories yet. Add some categories to start tracking!",
+            foreground=self.text_color
+        )
         
     def create_weekly_overview(self, parent):
         """Create weekly overview section"""
@@ -201,7 +420,7 @@ class ConsistencyTracker:
         # Day labels
         days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
         for i, day in enumerate(days):
-            label = ttk.Label(self.week_grid, text=day, font=('Helvetica', 9))
+            label = ttk.Label(self.week_grid, text=day, font=self.F_SMALL)
             label.grid(row=0, column=i, padx=5, pady=5)
             
         # Week circles (will be updated)
@@ -211,7 +430,7 @@ class ConsistencyTracker:
             circle_frame.grid(row=1, column=i, padx=5, pady=5)
             circle_frame.grid_propagate(False)
             
-            circle_label = ttk.Label(circle_frame, text="", font=('Helvetica', 10))
+            circle_label = ttk.Label(circle_frame, text="", font=self.F_BODY)
             circle_label.pack(expand=True, fill=tk.BOTH)
             
             self.week_circles.append(circle_label)
@@ -235,6 +454,12 @@ class ConsistencyTracker:
         # Categories list
         self.categories_list = ttk.Frame(categories_frame)
         self.categories_list.pack(fill=tk.BOTH, expand=True)
+        self._category_cards = {}
+        self._categories_empty = ttk.Label(
+            self.categories_list,
+            text="No categories yet. Click 'Add Category' to get started!",
+            foreground=self.text_color
+        )
         
     def create_calendar_tab(self):
         """Create monthly calendar tab"""
@@ -246,17 +471,57 @@ class ConsistencyTracker:
         nav_frame.pack(fill=tk.X, pady=10)
         
         ttk.Button(nav_frame, text="◀", command=self.prev_month).pack(side=tk.LEFT, padx=5)
-        self.month_label = ttk.Label(nav_frame, text="", font=('Helvetica', 12, 'bold'))
+        self.month_label = ttk.Label(nav_frame, text="", font=self.F_HEADER_BOLD)
         self.month_label.pack(side=tk.LEFT, padx=20)
         ttk.Button(nav_frame, text="▶", command=self.next_month).pack(side=tk.LEFT, padx=5)
         
-        # Calendar grid
-        self.calendar_grid = ttk.Frame(calendar_frame)
-        self.calendar_grid.pack(fill=tk.BOTH, expand=True, pady=10)
+        # Calendar drawn as items on a single canvas: a header row plus six
+        # weeks of cells, which covers any month
+        cell_w, cell_h, header_h = CAL_CELL_W, CAL_CELL_H, CAL_HEADER_H
+        self.cal_canvas = tk.Canvas(
+            calendar_frame,
+            width=7 * (cell_w + 2),
+            height=header_h + 6 * (cell_h + 2),
+            bg=self.bg_color,
+            highlightthickness=0
+        )
+        self.cal_canvas.pack(anchor='nw', pady=10)
         
+        # Day headers
+        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        for i, day in enumerate(days):
+            self.cal_canvas.create_text(
+                i * (cell_w + 2) + cell_w // 2 + 1,
+                header_h // 2,
+                text=day,
+                font=self.F_SMALL_BOLD
+            )
+            
+        # Cell items are created once; update_calendar only reconfigures them
+        self._cal_items = []
+        for i in range(42):
+            x = (i % 7) * (cell_w + 2) + 1
+            y = header_h + (i // 7) * (cell_h + 2) + 1
+            
+            self._cal_items.append({
+                'x': x,
+                'y': y,
+                'rect': self.cal_canvas.create_rectangle(
+                    x, y, x + cell_w, y + cell_h, outline=self.text_color
+                ),
+                'text': self.cal_canvas.create_text(
+                    x + 4, y + 4, anchor='nw', font=self.F_BODY_BOLD
+                ),
+                'bar': self.cal_canvas.create_rectangle(
+                    x + 2, y + cell_h - 8, x + 2, y + cell_h - 4,
+                    fill=self.primary_color, outline=''
+                )
+            })
+            
         # Current month/year
-        self.current_month = datetime.now().month
-        self.current_year = datetime.now().year
+        today = date.today()
+        self.current_month = today.month
+        self.current_year = today.year
         
     def create_analytics_tab(self):
         """Create analytics tab with charts"""
@@ -264,211 +529,568 @@ class ConsistencyTracker:
         self.notebook.add(analytics_frame, text="📊 Analytics")
         
         # Create matplotlib figure
-        self.fig, (self.ax1, self.ax2) = plt.subplots(1, 2, figsize=(10, 4))
+        self.fig, (self.ax1, self.ax2) = plt.subplots(1, 2, figsize=(10, 4),
+                                                      constrained_layout=True)
         self.fig.patch.set_facecolor(self.bg_color)
         
+        # Static decorations are drawn once; the data artists are animated
+        # and blitted over the cached background on refresh
+        self.ax1.set(frame_on=False, xticks=[], yticks=[], aspect='equal',
+                     xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
+        self.ax1.set_title('Time Distribution by Category')
+        self.ax2.set_title('Daily Total Minutes (Last 7 Days)')
+        self.ax2.set_xlabel('Day')
+        self.ax2.set_ylabel('Minutes')
+        self.ax2.set_xlim(-0.5, 6.5)
+        self.ax2.set_xticks(range(7))
+        self.ax2.grid(True, alpha=0.3)
+        
+        self._line, = self.ax2.plot(range(7), [0] * 7, marker='o',
+                                    color=self.primary_color, animated=True)
+        self._no_data_texts = [
+            ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
+                    transform=ax.transAxes, animated=True)
+            for ax in (self.ax1, self.ax2)
+        ]
+        self._pie_key = None
+        self._pie_wedges = []
+        self._pie_texts = []
+        self._pie_autotexts = []
+        self._analytics_bg = None
+        
         # Embed in tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, analytics_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self._on_analytics_draw)
         
     def load_data(self):
-        """Load data from JSON file"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.categories = data.get('categories', [])
-                    self.logs = data.get('logs', [])
-            except:
-                self.categories = []
-                self.logs = []
-                
-    def save_data(self):
-        """Save data to JSON file"""
-        data = {
-            'categories': self.categories,
-            'logs': self.logs
-        }
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
-            
-    def refresh_display(self):
-        """Refresh all displays"""
-        self.update_stats()
-        self.update_today_progress()
-        self.update_weekly_overview()
-        self.update_categories_list()
-        self.update_calendar()
-        self.update_analytics()
+        """Load the categories file and replay the log file
+        
+        Data from the single JSON file of earlier versions is read while
+        categories.json does not exist, and is then written out in the new
+        layout. The log file is written first, so categories.json only
+        appears once the migration is complete.
+        
+        Malformed records are skipped and copied to <file>.bad, so a later
+        save can not lose them. A file that can not be read at all is
+        never saved over.
+        """
+        # Lines in the log file that compaction would drop
+        self._garbage_lines = 0
+        self._unreadable = set()
+        rewrite = False
+        migrate = False
+        categories = []
+        if os.path.exists(self.categories_file):
+            categories = self._read_json_file(self.categories_file, list) or []
+            self.logs, rewrite = self._read_log_file()
+        elif os.path.exists(self.data_file):
+            data = self._read_json_file(self.data_file, dict)
+            if data is not None:
+                categories = data.get('categories')
+                logs = data.get('logs')
+                # The old file is left in place, so malformed records in it
+                # are simply not migrated
+                if isinstance(categories, list) and isinstance(logs, list):
+                    self.logs = [log for log in logs if _parse_log(log)]
+                    migrate = True
+                else:
+                    categories = []
+        elif os.path.exists(self.logs_file):
+            self.logs, rewrite = self._read_log_file()
+            
+        # Categories are kept by id, in their saved order
+        self.categories = {}
+        bad = []
+        for category in categories:
+            if _valid_category(category):
+                self.categories[category['id']] = category
+            else:
+                bad.append(_dumps(category) + b'\n')
+        if bad:
+            self._quarantine(self.categories_file, b''.join(bad))
+            
+        # Lookup indices kept up to date by every mutation
+        self._logs_by_cat = defaultdict(list)
+        # Running minute totals keyed by (category id, day ordinal)
+        self._minutes_by_cat_date = defaultdict(int)
+        for log in self.logs:
+            self._logs_by_cat[log['category_id']].append(log)
+            self._minutes_by_cat_date[log['category_id'], log['_date'].toordinal()] += log['minutes']
+            
+        self._build_log_arrays()
+        
+        if migrate:
+            # Logs first: categories.json marks the migration as done
+            self._compact()
+            self.wait_for_saves()
+            if not self._write_errors:
+                self.save_data()
+        elif rewrite:
+            # Drop torn log lines before appends could land on them
+            self._compact()
+        if bad and not migrate:
+            # Likewise drop quarantined categories from the live file
+            self.save_data()
+            
+    def _read_log_file(self):
+        """Read the log file, applying category tombstones in order
+        
+        Returns the logs and whether any line could not be parsed.
+        """
+        logs = []
+        bad = []
+        if not os.path.exists(self.logs_file):
+            return logs, False
+        try:
+            with open(self.logs_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        # Torn line from an interrupted append
+                        bad.append(line)
+                        continue
+                    if isinstance(record, dict) and record.get('op') == 'del_cat':
+                        kept = [log for log in logs if log['category_id'] != record.get('id')]
+                        self._garbage_lines += 1 + len(logs) - len(kept)
+                        logs = kept
+                    elif _parse_log(record):
+                        logs.append(record)
+                    else:
+                        bad.append(line)
+        except OSError:
+            traceback.print_exc()
+            self._unreadable.add(self.logs_file)
+            return logs, False
+            
+        if bad:
+            self._quarantine(self.logs_file, b''.join(
+                line if line.endswith(b'\n') else line + b'\n' for line in bad))
+            self._garbage_lines += len(bad)
+        return logs, bool(bad)
+        
+    def _read_json_file(self, path, kind):
+        """Parse a JSON file holding a value of type kind, None on failure
+        
+        An unparsable file is copied to <path>.bad, an unreadable one is
+        marked so that it is not saved over.
+        """
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            traceback.print_exc()
+            self._unreadable.add(path)
+            return None
+        try:
+            data = _loads(raw)
+        except ValueError:
+            data = None
+        if not isinstance(data, kind):
+            self._quarantine(path, raw)
+            return None
+        return data
+        
+    def _quarantine(self, path, payload):
+        """Append data that could not be loaded to <path>.bad"""
+        try:
+            with open(path + '.bad', 'ab') as f:
+                f.write(payload)
+        except OSError:
+            # Without a copy the original must not be replaced
+            traceback.print_exc()
+            self._unreadable.add(path)
+        
+    def _build_log_arrays(self):
+        """Pack the logs into a growable structured array for aggregation
+        
+        Only the first _log_n records of _log_arr are valid. The c field
+        holds positions into _cat_ids, which lists the category ids in
+        order followed by any ids of logs without a category.
+        """
+        self._cat_ids = list(self.categories)
+        self._cat_positions = {cat_id: i for i, cat_id in enumerate(self._cat_ids)}
+        
+        n = len(self.logs)
+        self._log_arr = np.empty(max(1024, 2 * n), dtype=LOG_DTYPE)
+        self._log_n = n
+        records = self._log_arr[:n]
+        records['d'] = np.fromiter((log['_date'].toordinal() for log in self.logs),
+                                   dtype=np.int32, count=n)
+        records['c'] = np.fromiter((self._cat_position(log['category_id']) for log in self.logs),
+                                   dtype=np.int16, count=n)
+        records['m'] = np.fromiter((log['minutes'] for log in self.logs),
+                                   dtype=np.int32, count=n)
+        
+    def _cat_position(self, category_id):
+        """Return the array position of a category id, adding unknown ones"""
+        position = self._cat_positions.get(category_id)
+        if position is None:
+            position = self._cat_positions[category_id] = len(self._cat_ids)
+            self._cat_ids.append(category_id)
+        return position
+        
+    def _append_log_arrays(self, log):
+        """Append a new log record, doubling the capacity when full"""
+        if self._log_n == len(self._log_arr):
+            self._log_arr = np.resize(self._log_arr, 2 * len(self._log_arr))
+            
+        self._log_arr[self._log_n] = (
+            log['_date'].toordinal(),
+            self._cat_position(log['category_id']),
+            log['minutes']
+        )
+        self._log_n += 1
         
-    def update_stats(self):
-        """Update statistics cards"""
-        # Calculate current streak
-        current_streak = self.calculate_current_streak()
-        self.stats_vars['current_streak'].set(str(current_streak))
+    def _log_records(self):
+        """Return the valid part of the log record array"""
+        return self._log_arr[:self._log_n]
         
-        # Calculate longest streak
-        longest_streak = self.calculate_longest_streak()
-        self.stats_vars['longest_streak'].set(str(longest_streak))
+    def save_data(self, pretty=False):
+        """Save the categories file, indented only when pretty is set
         
-        # Calculate monthly completion rate
-        completion_rate = self.calculate_monthly_completion()
-        self.stats_vars['completion_rate'].set(f"{completion_rate}%")
+        Logs are not part of it, they are appended as they are created.
+        """
+        if self.categories_file in self._unreadable:
+            return
+        # Serialize here so the writer gets a consistent snapshot
+        self._save_queue.put((self.categories_file, _dumps(list(self.categories.values()), pretty), False))
         
-        # Total logs
-        self.stats_vars['total_logs'].set(str(len(self.logs)))
+    def _append_log_record(self, record):
+        """Queue one record to be appended to the log file"""
+        self._save_queue.put((self.logs_file, _dumps(record) + b'\n', True))
         
-    def calculate_current_streak(self):
-        """Calculate current consistency streak"""
-        if not self.categories:
-            return 0
-            
-        streak = 0
-        check_date = datetime.now().date()
+    def _compact(self):
+        """Rewrite the log file with only the live logs"""
+        if self.logs_file in self._unreadable:
+            return
+        payload = b''.join(_dumps(_stored(log)) + b'\n' for log in self.logs)
+        self._save_queue.put((self.logs_file, payload, False))
+        self._garbage_lines = 0
         
+    def _writer_loop(self):
+        """Write queued file updates to disk on the writer thread
+        
+        Items are (path, payload, append) tuples. Appends to a file are
+        written in order, a full rewrite replaces everything queued
+        before it for the same file.
+        """
         while True:
-            day_logs = [log for log in self.logs 
-                       if datetime.strptime(log['date'], '%Y-%m-%d').date() == check_date]
-            
-            # Check if all categories were logged on this day
-            categories_logged = set(log['category_id'] for log in day_logs)
-            if len(categories_logged) < len(self.categories):
-                break
+            items = [self._save_queue.get()]
+            while True:
+                try:
+                    items.append(self._save_queue.get_nowait())
+                except queue.Empty:
+                    break
+                    
+            # Every item is marked done, even if writing fails, so that
+            # wait_for_saves() can never block forever
+            try:
+                self._write_items(items)
+            except Exception:
+                self._write_errors += 1
+                traceback.print_exc()
+            finally:
+                for _ in items:
+                    self._save_queue.task_done()
+                    
+    def _write_items(self, items):
+        """Write one batch of queued file updates"""
+        # Per file: whether it is rewritten and the chunks to write
+        pending = {}
+        for path, payload, append in items:
+            if append and path in pending:
+                pending[path][1].append(payload)
+            else:
+                pending[path] = (not append, [payload])
                 
-            streak += 1
-            check_date -= timedelta(days=1)
+        for path, (rewrite, chunks) in pending.items():
+            try:
+                if rewrite:
+                    tmp_file = path + '.tmp'
+                    with open(tmp_file, 'wb') as f:
+                        f.write(b''.join(chunks))
+                        # On disk before the rename, so a crash leaves
+                        # either the old or the new file complete
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_file, path)
+                else:
+                    with open(path, 'ab') as f:
+                        f.write(b''.join(chunks))
+                        f.flush()
+                        os.fsync(f.fileno())
+            except Exception:
+                # Keep going with the other files
+                self._write_errors += 1
+                traceback.print_exc()
+                
+    def _mark_dirty(self):
+        """Record unsaved changes and schedule a batched save"""
+        self._dirty = True
+        if self._flush_job is None:
+            self._flush_job = self.root.after(SAVE_DELAY_MS, self._flush)
             
-        return streak
-        
-    def calculate_longest_streak(self):
-        """Calculate longest streak ever"""
-        if not self.logs:
-            return 0
+    def _flush(self, wait=False, compact=False, pretty=False):
+        """Save pending changes, optionally compacting and waiting"""
+        job, self._flush_job = self._flush_job, None
+        if job is not None:
+            self.root.after_cancel(job)
+        if self._dirty:
+            self._dirty = False
+            self.save_data(pretty)
+        if compact and self._garbage_lines:
+            self._compact()
+        if wait:
+            self.wait_for_saves()
             
-        # Group logs by date
-        logs_by_date = defaultdict(set)
+    def _on_close(self):
+        """Save pending changes and close the window"""
+        self._flush(compact=True)
+        self.root.destroy()
+        
+    def wait_for_saves(self):
+        """Block until all queued saves are written"""
+        self._save_queue.join()
+        
+    def _build_indices(self):
+        """Index logs by day ordinal and category in a single pass"""
+        coverage = defaultdict(set)
         for log in self.logs:
-            logs_by_date[log['date']].add(log['category_id'])
+            coverage[log['_date'].toordinal()].add(log['category_id'])
             
-        dates = sorted(logs_by_date.keys())
-        if not dates:
-            return 0
+        self._coverage_by_ord = coverage
+        
+        # Sorted ordinals of days with a log of a known category, and of
+        # days on which every category was logged
+        records = self._log_records()
+        n_cats = len(self.categories)
+        known = records['c'] < n_cats
+        pairs = np.unique(records['d'][known].astype(np.int64) * n_cats + records['c'][known])
+        days, counts = np.unique(pairs // max(n_cats, 1), return_counts=True)
+        self._logged_days = days
+        self._full_days = days[counts == n_cats]
+        
+    def _index_log(self, log):
+        """Add a new log of a known category to the day indices
+        
+        Only needed while the indices are current; stale ones are
+        rebuilt from all logs on the next refresh anyway.
+        """
+        if self._indices_stale:
+            return
+        day = log['_date'].toordinal()
+        covered = self._coverage_by_ord[day]
+        covered.add(log['category_id'])
+        self._logged_days = _insert_sorted(self._logged_days, day)
+        if self.categories.keys() <= covered:
+            self._full_days = _insert_sorted(self._full_days, day)
             
-        longest = 1
-        current = 1
-        
-        for i in range(1, len(dates)):
-            prev_date = datetime.strptime(dates[i-1], '%Y-%m-%d').date()
-            curr_date = datetime.strptime(dates[i], '%Y-%m-%d').date()
+    def refresh_display(self, sections=None):
+        """Schedule a refresh of the given display sections
+        
+        Without sections the data is assumed to have changed: the log
+        indices are rebuilt and every section is redrawn. Requests made
+        before the event loop goes idle are coalesced into one redraw.
+        """
+        if sections is None:
+            self._indices_stale = True
+            self._stale_rows = {'today': None, 'categories': None}
+            sections = REFRESH_SECTIONS
+        self._pending_sections.update(sections)
+        
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._flush_refresh)
+        
+    def _refresh_category(self, category_id):
+        """Schedule a refresh after a change confined to one category
+        
+        The aggregate sections are redrawn as usual, but only this
+        category's today row and category card are updated.
+        """
+        for rows in self._stale_rows.values():
+            if rows is not None:
+                rows.add(category_id)
+        self.refresh_display(REFRESH_SECTIONS)
+        
+    def _take_stale_rows(self, section):
+        """Return the categories whose rows in section need an update,
+        or None when all of them do"""
+        rows = self._stale_rows[section]
+        self._stale_rows[section] = set()
+        if rows is None:
+            return None
+        return [self.categories[cid] for cid in rows if cid in self.categories]
+        
+    def _flush_refresh(self):
+        """Run the scheduled refresh"""
+        sections = self._pending_sections
+        self._pending_sections = set()
+        self._refresh_pending = False
+        self._do_refresh(sections)
+        
+    def _do_refresh(self, sections):
+        """Redraw the given display sections
+        
+        Sections on hidden notebook tabs are only marked dirty and are
+        redrawn once their tab is selected.
+        """
+        # Capture the date once per refresh; a new day invalidates the indices
+        today = date.today()
+        if today != self._today:
+            self._today = today
+            self._start_of_week = today - timedelta(days=today.weekday())
+            self._indices_stale = True
+            self._stale_rows = {'today': None, 'categories': None}
             
-            if (curr_date - prev_date).days == 1:
-                current += 1
-                longest = max(longest, current)
-            else:
-                current = 1
-                
-        return longest
-        
-    def calculate_monthly_completion(self):
-        """Calculate completion rate for current month"""
-        today = datetime.now()
-        days_in_month = calendar.monthrange(today.year, today.month)[1]
-        
-        if not self.categories:
-            return 0
+        if self._indices_stale:
+            self._build_indices()
+            self._indices_stale = False
             
-        completed_days = 0
-        for day in range(1, days_in_month + 1):
-            check_date = date(today.year, today.month, day)
-            day_logs = [log for log in self.logs 
-                       if datetime.strptime(log['date'], '%Y-%m-%d').date() == check_date]
+        visible_tab = self._visible_tab()
+        updaters = {
+            'stats': self.update_stats,
+            'today': self.update_today_progress,
+            'weekly': self.update_weekly_overview,
+            'categories': self.update_categories_list,
+            'calendar': self.update_calendar,
+            'analytics': self.update_analytics
+        }
+        for section in REFRESH_SECTIONS:
+            if section not in sections:
+                continue
+            if SECTION_TABS.get(section, visible_tab) != visible_tab:
+                self._dirty_sections.add(section)
+                continue
+            self._dirty_sections.discard(section)
+            updaters[section]()
             
-            categories_logged = set(log['category_id'] for log in day_logs)
-            if len(categories_logged) == len(self.categories):
-                completed_days += 1
-                
-        return int((completed_days / days_in_month) * 100) if days_in_month > 0 else 0
+    def _visible_tab(self):
+        """Return the name of the selected notebook tab"""
+        return TABS[self.notebook.index(self.notebook.select())]
         
-    def update_today_progress(self):
-        """Update today's progress display"""
-        # Clear existing widgets
-        for widget in self.today_frame.winfo_children():
-            widget.destroy()
-            
-        if not self.categories:
-            ttk.Label(
-                self.today_frame,
-                text="No categories yet. Add some categories to start tracking!",
-                foreground=self.text_color
-            ).pack(pady=20)
+    def _on_tab_changed(self, event):
+        """Redraw the dirty sections of the newly selected tab"""
+        if not self._dirty_sections:
             return
-            
-        today = datetime.now().date().isoformat()
+        visible_tab = self._visible_tab()
+        sections = {s for s in self._dirty_sections if SECTION_TABS[s] == visible_tab}
+        if sections:
+            self._do_refresh(sections)
         
-        for category in self.categories:
-            # Get today's logs for this category
-            category_logs = [log for log in self.logs 
-                           if log['category_id'] == category['id'] and log['date'] == today]
+    def update_stats(self):
+        """Update statistics cards"""
+        current_streak, longest_streak, completion_rate = self.calculate_streaks()
+        
+        self.stats_vars['current_streak'].set(str(current_streak))
+        self.stats_vars['longest_streak'].set(str(longest_streak))
+        self.stats_vars['completion_rate'].set(f"{completion_rate}%")
+        
+        # Total logs
+        self.stats_vars['total_logs'].set(str(len(self.logs)))
+        
+    def calculate_streaks(self):
+        """Calculate current streak, longest streak and monthly completion rate"""
+        today = self._today
+        days_in_month = _days_in_month(today.year, today.month)
+        
+        month_start = date(today.year, today.month, 1).toordinal()
+        current, longest, completed_days = _streaks(
+            self._logged_days,
+            self._full_days,
+            today.toordinal(),
+            month_start,
+            month_start + days_in_month
+        )
+        
+        completion_rate = int((completed_days / days_in_month) * 100)
+        return current, longest, completion_rate
+        
+    def update_today_progress(self):
+        """Update today's progress display"""
+        categories = self._take_stale_rows('today')
+        if categories is None:
+            categories = self.categories.values()
             
-            total_minutes = sum(log['minutes'] for log in category_logs)
+            # Show the placeholder only while there are no categories
+            if not self.categories:
+                self._today_empty.pack(pady=20)
+            else:
+                self._today_empty.pack_forget()
+                
+            # Drop rows of deleted categories, reuse the rest
+            for cat_id in list(self._today_rows):
+                if cat_id not in self.categories:
+                    self._today_rows.pop(cat_id)['frame'].destroy()
+                    
+        today_ord = self._today.toordinal()
+        for category in categories:
+            row = self._today_rows.get(category['id'])
+            if row is None:
+                row = self.create_today_row(category)
+                self._today_rows[category['id']] = row
+                
+            total_minutes = self._minutes_by_cat_date.get((category['id'], today_ord), 0)
             goal = category['goal']
             progress = min((total_minutes / goal) * 100, 100) if goal > 0 else 0
             
-            # Category frame
-            cat_frame = ttk.Frame(self.today_frame)
-            cat_frame.pack(fill=tk.X, pady=5)
-            
-            # Category info
-            info_frame = ttk.Frame(cat_frame)
-            info_frame.pack(fill=tk.X)
-            
-            ttk.Label(
-                info_frame,
-                text=category['name'],
-                font=('Helvetica', 11, 'bold'),
-                foreground=category['color']
-            ).pack(side=tk.LEFT)
-            
-            ttk.Label(
-                info_frame,
-                text=f"{total_minutes}/{goal} min",
-                font=('Helvetica', 10)
-            ).pack(side=tk.LEFT, padx=10)
-            
-            ttk.Button(
-                info_frame,
-                text="Log Progress",
-                command=lambda c=category: self.log_progress_dialog(c)
-            ).pack(side=tk.RIGHT)
-            
-            # Progress bar
-            progress_frame = ttk.Frame(cat_frame, height=10)
-            progress_frame.pack(fill=tk.X, pady=(5, 0))
-            
-            # Create custom progress bar
-            canvas = tk.Canvas(progress_frame, height=10, highlightthickness=0)
-            canvas.pack(fill=tk.X)
-            
-            # Draw background
-            canvas.create_rectangle(0, 0, 1000, 10, fill='#e2e8f0', outline='')
-            
-            # Draw progress
-            if progress > 0:
-                canvas.create_rectangle(0, 0, 10 * progress, 10, 
-                                      fill=category['color'], outline='')
-                
+            row['name'].configure(text=category['name'], foreground=category['color'])
+            row['minutes'].configure(text=f"{total_minutes}/{goal} min")
+            row['pb'].configure(
+                value=progress,
+                style=self.bar_style(category['color'], self.track_color, 10)
+            )
+            
+    def create_today_row(self, category):
+        """Create the widgets of a today's progress row"""
+        # Category frame
+        cat_frame = ttk.Frame(self.today_frame)
+        cat_frame.pack(fill=tk.X, pady=5)
+        
+        # Category info
+        info_frame = ttk.Frame(cat_frame)
+        info_frame.pack(fill=tk.X)
+        
+        name_label = ttk.Label(
+            info_frame,
+            font=self.F_SUBTITLE
+        )
+        name_label.pack(side=tk.LEFT)
+        
+        minutes_label = ttk.Label(
+            info_frame,
+            font=self.F_BODY
+        )
+        minutes_label.pack(side=tk.LEFT, padx=10)
+        
+        ttk.Button(
+            info_frame,
+            text="Log Progress",
+            command=lambda c=category: self.log_progress_dialog(c)
+        ).pack(side=tk.RIGHT)
+        
+        # Progress bar
+        pb = ttk.Progressbar(cat_frame, mode='determinate', maximum=100)
+        pb.pack(fill=tk.X, pady=(5, 0))
+        
+        return {
+            'frame': cat_frame,
+            'name': name_label,
+            'minutes': minutes_label,
+            'pb': pb
+        }
+        
     def update_weekly_overview(self):
         """Update weekly overview display"""
-        today = datetime.now().date()
-        start_of_week = today - timedelta(days=today.weekday())
-        
+        start_ord = self._start_of_week.toordinal()
         for i in range(7):
-            check_date = start_of_week + timedelta(days=i)
-            date_str = check_date.isoformat()
+            check_date = self._start_of_week + timedelta(days=i)
             
-            # Get logs for this day
-            day_logs = [log for log in self.logs if log['date'] == date_str]
-            categories_logged = set(log['category_id'] for log in day_logs)
+            # Get categories logged on this day
+            categories_logged = self._coverage_by_ord.get(start_ord + i, EMPTY)
             
             # Calculate completion
             if not self.categories:
@@ -484,27 +1106,40 @@ class ConsistencyTracker:
             elif completion > 0:
                 circle.configure(text="~", background=self.warning_color)
             else:
-                circle.configure(text="○", background='#e2e8f0')
+                circle.configure(text="○", background=self.track_color)
                 
             # Add date number
             circle.configure(text=f"{check_date.day}\n{circle.cget('text')}")
             
     def update_categories_list(self):
         """Update categories list display"""
-        # Clear existing widgets
-        for widget in self.categories_list.winfo_children():
-            widget.destroy()
-            
-        if not self.categories:
-            ttk.Label(
-                self.categories_list,
-                text="No categories yet. Click 'Add Category' to get started!",
-                foreground=self.text_color
-            ).pack(pady=20)
-            return
+        categories = self._take_stale_rows('categories')
+        if categories is None:
+            categories = self.categories.values()
             
-        for category in self.categories:
-            self.create_category_card(category)
+            # Show the placeholder only while there are no categories
+            if not self.categories:
+                self._categories_empty.pack(pady=20)
+            else:
+                self._categories_empty.pack_forget()
+                
+            # Drop cards of deleted categories, reuse the rest
+            for cat_id in list(self._category_cards):
+                if cat_id not in self.categories:
+                    self._category_cards.pop(cat_id)['card'].destroy()
+                    
+        for category in categories:
+            card = self._category_cards.get(category['id'])
+            if card is None:
+                card = self.create_category_card(category)
+                self._category_cards[category['id']] = card
+                
+            # Calculate streak for this category
+            streak = self.calculate_category_streak(category['id'])
+            
+            card['name'].configure(text=category['name'], foreground=category['color'])
+            card['goal'].configure(text=f"Goal: {category['goal']} min/day")
+            card['streak'].configure(text=f"🔥 {streak} day streak")
             
     def create_category_card(self, category):
         """Create a category card"""
@@ -515,26 +1150,23 @@ class ConsistencyTracker:
         info_frame = ttk.Frame(card)
         info_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Label(
+        name_label = ttk.Label(
             info_frame,
-            text=category['name'],
-            font=('Helvetica', 12, 'bold'),
-            foreground=category['color']
-        ).pack(side=tk.LEFT)
+            font=self.F_HEADER_BOLD
+        )
+        name_label.pack(side=tk.LEFT)
         
-        ttk.Label(
+        goal_label = ttk.Label(
             info_frame,
-            text=f"Goal: {category['goal']} min/day",
-            font=('Helvetica', 10)
-        ).pack(side=tk.LEFT, padx=20)
+            font=self.F_BODY
+        )
+        goal_label.pack(side=tk.LEFT, padx=20)
         
-        # Calculate streak for this category
-        streak = self.calculate_category_streak(category['id'])
-        ttk.Label(
+        streak_label = ttk.Label(
             info_frame,
-            text=f"🔥 {streak} day streak",
-            font=('Helvetica', 10)
-        ).pack(side=tk.LEFT)
+            font=self.F_BODY
+        )
+        streak_label.pack(side=tk.LEFT)
         
         # Buttons
         btn_frame = ttk.Frame(info_frame)
@@ -561,74 +1193,48 @@ class ConsistencyTracker:
             width=8
         ).pack(side=tk.LEFT, padx=2)
         
+        return {
+            'card': card,
+            'name': name_label,
+            'goal': goal_label,
+            'streak': streak_label
+        }
+        
     def calculate_category_streak(self, category_id):
         """Calculate streak for a specific category"""
-        # Get all logs for this category, sorted by date
-        category_logs = [log for log in self.logs if log['category_id'] == category_id]
-        dates = sorted(set(log['date'] for log in category_logs))
-        
-        if not dates:
-            return 0
-            
-        # Calculate current streak
+        # Walk back from today until a day without this category
         streak = 0
-        check_date = datetime.now().date()
+        day = self._today.toordinal()
         
-        while True:
-            date_str = check_date.isoformat()
-            if date_str in dates:
-                streak += 1
-                check_date -= timedelta(days=1)
-            else:
-                break
-                
+        while category_id in self._coverage_by_ord.get(day, EMPTY):
+            streak += 1
+            day -= 1
+            
         return streak
         
     def update_calendar(self):
         """Update calendar display"""
-        # Clear grid
-        for widget in self.calendar_grid.winfo_children():
-            widget.destroy()
-            
         # Update month label
         self.month_label.config(
             text=datetime(self.current_year, self.current_month, 1).strftime("%B %Y")
         )
         
         # Get days in month
-        days_in_month = calendar.monthrange(self.current_year, self.current_month)[1]
+        days_in_month = _days_in_month(self.current_year, self.current_month)
         first_day = datetime(self.current_year, self.current_month, 1).weekday()
-        
-        # Day headers
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        for i, day in enumerate(days):
-            ttk.Label(
-                self.calendar_grid,
-                text=day,
-                font=('Helvetica', 9, 'bold')
-            ).grid(row=0, column=i, padx=2, pady=2)
-            
-        # Create calendar cells
-        row = 1
-        col = first_day
-        
-        for day in range(1, days_in_month + 1):
-            date_str = f"{self.current_year}-{self.current_month:02d}-{day:02d}"
-            
-            # Create cell
-            cell = ttk.Frame(
-                self.calendar_grid,
-                relief='solid',
-                borderwidth=1,
-                width=80,
-                height=60
-            )
-            cell.grid(row=row, column=col, padx=1, pady=1, sticky='nsew')
-            cell.grid_propagate(False)
-            
+        month_ord = date(self.current_year, self.current_month, 1).toordinal()
+        
+        # Fill the fixed cell grid, hiding cells outside the month
+        canvas = self.cal_canvas
+        for i, items in enumerate(self._cal_items):
+            day = i - first_day + 1
+            if not 1 <= day <= days_in_month:
+                for item in (items['rect'], items['text'], items['bar']):
+                    canvas.itemconfig(item, state='hidden')
+                continue
+                
             # Get completion for this day
-            day_logs = [log for log in self.logs if log['date'] == date_str]
-            categories_logged = set(log['category_id'] for log in day_logs)
+            categories_logged = self._coverage_by_ord.get(month_ord + day - 1, EMPTY)
             
             if self.categories:
                 completion = len(categories_logged) / len(self.categories)
@@ -641,95 +1247,214 @@ class ConsistencyTracker:
             elif completion > 0:
                 bg_color = self.warning_color
             else:
-                bg_color = '#f7fafc'
+                bg_color = self.empty_day_color
                 
-            # Day number
-            ttk.Label(
-                cell,
-                text=str(day),
-                font=('Helvetica', 10, 'bold'),
-                background=bg_color
-            ).pack(anchor='nw', padx=2, pady=2)
+            # Cell and day number
+            canvas.itemconfig(items['rect'], fill=bg_color, state='normal')
+            canvas.itemconfig(items['text'], text=str(day), state='normal')
             
             # Completion bar
             if completion > 0:
-                bar_frame = ttk.Frame(cell, height=4)
-                bar_frame.pack(fill=tk.X, padx=2, pady=(0, 2))
-                
-                canvas = tk.Canvas(bar_frame, height=4, highlightthickness=0, bg=bg_color)
-                canvas.pack(fill=tk.X)
-                canvas.create_rectangle(0, 0, 76 * completion, 4, 
-                                      fill=self.primary_color, outline='')
-                                      
-            col += 1
-            if col > 6:
-                col = 0
-                row += 1
+                x, y = items['x'], items['y']
+                canvas.coords(items['bar'], x + 2, y + CAL_CELL_H - 8,
+                              x + 2 + (CAL_CELL_W - 4) * completion, y + CAL_CELL_H - 4)
+                canvas.itemconfig(items['bar'], state='normal')
+            else:
+                canvas.itemconfig(items['bar'], state='hidden')
                 
     def update_analytics(self):
         """Update analytics charts"""
-        # Clear axes
-        self.ax1.clear()
-        self.ax2.clear()
-        
-        if not self.categories or not self.logs:
-            self.ax1.text(0.5, 0.5, 'No data available', 
-                         ha='center', va='center', transform=self.ax1.transAxes)
-            self.ax2.text(0.5, 0.5, 'No data available', 
-                         ha='center', va='center', transform=self.ax2.transAxes)
-        else:
+        has_data = bool(self.categories and self.logs)
+        full_draw = self._analytics_bg is None
+        
+        for text in self._no_data_texts:
+            text.set_visible(not has_data)
+        for artist in self._pie_artists():
+            artist.set_visible(has_data)
+        self._line.set_visible(has_data)
+        
+        if has_data:
             # Category distribution pie chart
-            category_totals = defaultdict(int)
-            for log in self.logs:
-                category_totals[log['category_id']] += log['minutes']
-                
-            if category_totals:
-                sizes = list(category_totals.values())
-                labels = []
-                for cat_id in category_totals.keys():
-                    category = next((c for c in self.categories if c['id'] == cat_id), None)
-                    labels.append(category['name'] if category else 'Unknown')
-                    
-                colors = [next((c['color'] for c in self.categories if c['id'] == cat_id), '#667eea') 
-                         for cat_id in category_totals.keys()]
-                         
-                self.ax1.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%')
-                self.ax1.set_title('Time Distribution by Category')
+            records = self._log_records()
+            totals = np.bincount(records['c'], weights=records['m'],
+                                 minlength=len(self._cat_ids))
+            
+            sizes = []
+            labels = []
+            colors = []
+            unknown = {'name': 'Unknown', 'color': '#667eea'}
+            for i in np.flatnonzero(totals):
+                category = self.categories.get(self._cat_ids[i], unknown)
+                sizes.append(int(totals[i]))
+                labels.append(category['name'])
+                colors.append(category['color'])
+            
+            pie_key = tuple(zip(labels, colors))
+            if pie_key != self._pie_key:
+                # Different wedges, rebuild the pie
+                self._set_pie(sizes, labels, colors)
+                self._pie_key = pie_key
+                full_draw = True
+            else:
+                self._move_pie(sizes)
                 
             # Weekly progress line chart
-            last_7_days = []
-            dates = []
-            for i in range(6, -1, -1):
-                date = datetime.now().date() - timedelta(days=i)
-                dates.append(date.strftime('%a'))
-                
-                day_logs = [log for log in self.logs if log['date'] == date.isoformat()]
-                total_minutes = sum(log['minutes'] for log in day_logs)
-                last_7_days.append(total_minutes)
-                
-            self.ax2.plot(dates, last_7_days, marker='o', color=self.primary_color)
-            self.ax2.set_title('Daily Total Minutes (Last 7 Days)')
-            self.ax2.set_xlabel('Day')
-            self.ax2.set_ylabel('Minutes')
-            self.ax2.grid(True, alpha=0.3)
+            first_day = self._today - timedelta(days=6)
+            dates = [(first_day + timedelta(days=i)).strftime('%a') for i in range(7)]
+            
+            offsets = records['d'] - first_day.toordinal()
+            in_week = (offsets >= 0) & (offsets < 7)
+            last_7_days = np.bincount(offsets[in_week], weights=records['m'][in_week],
+                                      minlength=7).astype(int).tolist()
+            
+            self._line.set_ydata(last_7_days)
             
+            # Axis changes need a full draw, so the y range grows in hour steps
+            top = (max(last_7_days) // 60 + 1) * 60
+            if self.ax2.get_ylim() != (-top * 0.05, top):
+                self.ax2.set_ylim(-top * 0.05, top)
+                full_draw = True
+            if [t.get_text() for t in self.ax2.get_xticklabels()] != dates:
+                self.ax2.set_xticks(range(7), dates)
+                full_draw = True
+                
         # Refresh canvas
-        self.fig.tight_layout()
-        self.canvas.draw()
+        if full_draw:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._analytics_bg)
+            self._draw_analytics_artists()
+            self.canvas.blit(self.fig.bbox)
+            
+    def _pie_artists(self):
+        """Return all artists of the pie chart"""
+        return self._pie_wedges + self._pie_texts + self._pie_autotexts
+        
+    def _set_pie(self, sizes, labels, colors):
+        """Replace the pie chart artists"""
+        for artist in self._pie_artists():
+            artist.remove()
+            
+        wedges, texts, autotexts = self.ax1.pie(
+            sizes, labels=labels, colors=colors, autopct='%1.1f%%'
+        )
+        for artist in (*wedges, *texts, *autotexts):
+            artist.set_animated(True)
+            
+        self._pie_wedges = list(wedges)
+        self._pie_texts = list(texts)
+        self._pie_autotexts = list(autotexts)
+        
+    def _move_pie(self, sizes):
+        """Update wedge angles and label positions in place
+        
+        Mirrors the layout of Axes.pie with its default start angle,
+        radius, label distance and percentage distance.
+        """
+        total = sum(sizes)
+        theta1 = 0
+        for wedge, text, autotext, size in zip(
+                self._pie_wedges, self._pie_texts, self._pie_autotexts, sizes):
+            frac = size / total
+            theta2 = theta1 + frac
+            wedge.set_theta1(360 * theta1)
+            wedge.set_theta2(360 * theta2)
+            
+            angle = np.pi * (theta1 + theta2)
+            x, y = np.cos(angle), np.sin(angle)
+            text.set_position((1.1 * x, 1.1 * y))
+            text.set_horizontalalignment('left' if x > 0 else 'right')
+            autotext.set_position((0.6 * x, 0.6 * y))
+            autotext.set_text('%1.1f%%' % (100 * frac))
+            theta1 = theta2
+            
+    def _draw_analytics_artists(self):
+        """Draw the animated chart artists onto the canvas"""
+        for artist in (*self._pie_artists(), self._line, *self._no_data_texts):
+            self.fig.draw_artist(artist)
+            
+    def _on_analytics_draw(self, event):
+        """Cache the static background after a full draw"""
+        self._analytics_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_analytics_artists()
+        
+    def center_dialog(self, dialog, width, height):
+        """Size a dialog and center it on the screen in one geometry call"""
+        x = (self._screen_width - width) // 2
+        y = (self._screen_height - height) // 2
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
+        
+    def _first_free_id(self):
+        """Return a counter start above every loaded id
+        
+        Ids are the counter in hex. The clock is only a floor, so ids
+        stay unique when it moves back or data comes from another machine.
+        """
+        start = int(time.time() * 1000)
+        for record in itertools.chain(self.categories.values(), self.logs):
+            try:
+                start = max(start, int(str(record['id']), 16) + 1)
+            except (KeyError, ValueError):
+                pass
+        return start
+        
+    def new_id(self):
+        """Return a fresh id for a category or log"""
+        return f"{next(self._id_counter):x}"
+        
+    def hide_dialog(self, dialog):
+        """Release and hide a reusable dialog"""
+        dialog.grab_release()
+        dialog.withdraw()
+        
+    def show_dialog(self, dialog, title, width, height, focus):
+        """Retitle, center and show a reusable dialog, focusing an entry"""
+        dialog.title(title)
+        self.center_dialog(dialog, width, height)
+        dialog.deiconify()
+        dialog.grab_set()
+        focus.focus_set()
         
-    def add_category_dialog(self):
-        """Dialog to add a new category"""
+    def create_dialog(self):
+        """Create a hidden dialog window that is reused across opens"""
         dialog = tk.Toplevel(self.root)
-        dialog.title("Add Category")
-        dialog.geometry("300x250")
+        dialog.withdraw()
         dialog.transient(self.root)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self.hide_dialog(dialog))
+        dialog.bind('<Escape>', lambda e: self.hide_dialog(dialog))
+        return dialog
+        
+    def add_category_dialog(self):
+        """Dialog to add a new category"""
+        self.open_category_dialog("Add Category", None)
         
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f'+{x}+{y}')
+    def edit_category_dialog(self, category):
+        """Dialog to edit a category"""
+        self.open_category_dialog("Edit Category", category)
+        
+    def open_category_dialog(self, title, category):
+        """Show the category dialog, editing category or adding when None"""
+        if self._category_dialog is None:
+            self._category_dialog = self.create_category_dialog()
+            
+        ctx = self._category_dialog
+        ctx['category'] = category
+        
+        # Fill the form with the current values
+        ctx['name_entry'].delete(0, tk.END)
+        ctx['goal_entry'].delete(0, tk.END)
+        if category is None:
+            ctx['color_var'].set(PALETTE[0])
+        else:
+            ctx['name_entry'].insert(0, category['name'])
+            ctx['goal_entry'].insert(0, str(category['goal']))
+            ctx['color_var'].set(category['color'])
+            
+        self.show_dialog(ctx['dialog'], title, 300, 250, ctx['name_entry'])
+        
+    def create_category_dialog(self):
+        """Build the widgets of the add/edit category dialog"""
+        dialog = self.create_dialog()
         
         # Form fields
         ttk.Label(dialog, text="Category Name:").pack(pady=(10, 5))
@@ -741,152 +1466,105 @@ class ConsistencyTracker:
         goal_entry.pack(pady=5)
         
         ttk.Label(dialog, text="Color:").pack(pady=5)
-        colors = ['#667eea', '#48bb78', '#f56565', '#ed8936', '#9f7aea']
-        color_var = tk.StringVar(value=colors[0])
+        color_var = tk.StringVar(value=PALETTE[0])
         
         color_frame = ttk.Frame(dialog)
         color_frame.pack(pady=5)
         
-        for color in colors:
+        for color in PALETTE:
             rb = ttk.Radiobutton(
                 color_frame,
                 variable=color_var,
                 value=color,
-                text=''
+                text='',
+                style=self.swatch_styles[color]
             )
             rb.pack(side=tk.LEFT, padx=2)
             
-            # Color indicator
-            indicator = tk.Canvas(color_frame, width=20, height=20, bg=color, highlightthickness=0)
-            indicator.pack(side=tk.LEFT, padx=2)
-            
-        def save():
-            name = name_entry.get().strip()
-            goal = goal_entry.get().strip()
-            
-            if not name:
-                messagebox.showerror("Error", "Please enter a category name")
-                return
-                
-            try:
-                goal = int(goal)
-                if goal <= 0:
-                    raise ValueError
-            except:
-                messagebox.showerror("Error", "Please enter a valid positive number for goal")
-                return
-                
-            # Create new category
-            new_category = {
-                'id': datetime.now().strftime('%Y%m%d%H%M%S'),
-                'name': name,
-                'goal': goal,
-                'color': color_var.get()
-            }
-            
-            self.categories.append(new_category)
-            self.save_data()
-            self.refresh_display()
-            
-            dialog.destroy()
-            
         # Buttons
         button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=20)
         
-        ttk.Button(button_frame, text="Save", command=save).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
-        
-    def edit_category_dialog(self, category):
-        """Dialog to edit a category"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Edit Category")
-        dialog.geometry("300x250")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f'+{x}+{y}')
-        
-        # Form fields with current values
-        ttk.Label(dialog, text="Category Name:").pack(pady=(10, 5))
-        name_entry = ttk.Entry(dialog, width=30)
-        name_entry.insert(0, category['name'])
-        name_entry.pack(pady=5)
-        
-        ttk.Label(dialog, text="Daily Goal (minutes):").pack(pady=5)
-        goal_entry = ttk.Entry(dialog, width=30)
-        goal_entry.insert(0, str(category['goal']))
-        goal_entry.pack(pady=5)
-        
-        ttk.Label(dialog, text="Color:").pack(pady=5)
-        colors = ['#667eea', '#48bb78', '#f56565', '#ed8936', '#9f7aea']
-        color_var = tk.StringVar(value=category['color'])
+        ttk.Button(button_frame, text="Save", command=self.save_category).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel",
+                   command=lambda: self.hide_dialog(dialog)).pack(side=tk.LEFT, padx=5)
+        dialog.bind('<Return>', lambda e: self.save_category())
+        
+        return {
+            'dialog': dialog,
+            'name_entry': name_entry,
+            'goal_entry': goal_entry,
+            'color_var': color_var,
+            'category': None
+        }
         
-        color_frame = ttk.Frame(dialog)
-        color_frame.pack(pady=5)
+    def save_category(self):
+        """Validate the category dialog and add or update the category"""
+        from tkinter import messagebox
+        ctx = self._category_dialog
+        name = ctx['name_entry'].get().strip()
+        goal = ctx['goal_entry'].get().strip()
         
-        for color in colors:
-            rb = ttk.Radiobutton(
-                color_frame,
-                variable=color_var,
-                value=color,
-                text=''
-            )
-            rb.pack(side=tk.LEFT, padx=2)
+        if not name:
+            messagebox.showerror("Error", "Please enter a category name")
+            return
+            
+        try:
+            goal = int(goal)
+            if goal <= 0:
+                raise ValueError
+        except (ValueError, TypeError):
+            messagebox.showerror("Error", "Please enter a valid positive number for goal")
+            return
             
-            indicator = tk.Canvas(color_frame, width=20, height=20, bg=color, highlightthickness=0)
-            indicator.pack(side=tk.LEFT, padx=2)
+        category = ctx['category']
+        if category is None:
+            # Create new category
+            new_category = {
+                'id': self.new_id(),
+                'name': name,
+                'goal': goal,
+                'color': ctx['color_var'].get()
+            }
             
-        def save():
-            name = name_entry.get().strip()
-            goal = goal_entry.get().strip()
+            self.categories[new_category['id']] = new_category
+            self._build_log_arrays()
             
-            if not name:
-                messagebox.showerror("Error", "Please enter a category name")
-                return
-                
-            try:
-                goal = int(goal)
-                if goal <= 0:
-                    raise ValueError
-            except:
-                messagebox.showerror("Error", "Please enter a valid positive number for goal")
-                return
-                
+            # Save right away, logs for the new category are appended at once
+            self._dirty = True
+            self._flush()
+            self.refresh_display()
+        else:
             # Update category
             category['name'] = name
             category['goal'] = goal
-            category['color'] = color_var.get()
+            category['color'] = ctx['color_var'].get()
             
-            self.save_data()
-            self.refresh_display()
-            
-            dialog.destroy()
+            self._mark_dirty()
+            self._refresh_category(category['id'])
             
-        # Buttons
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(pady=20)
-        
-        ttk.Button(button_frame, text="Save", command=save).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        self.hide_dialog(ctx['dialog'])
         
     def log_progress_dialog(self, category):
         """Dialog to log progress for a category"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title(f"Log Progress - {category['name']}")
-        dialog.geometry("300x200")
-        dialog.transient(self.root)
-        dialog.grab_set()
+        if self._log_dialog is None:
+            self._log_dialog = self.create_log_dialog()
+            
+        ctx = self._log_dialog
+        ctx['category'] = category
+        
+        # Reset the form
+        ctx['minutes_entry'].delete(0, tk.END)
+        ctx['date_entry'].delete(0, tk.END)
+        ctx['date_entry'].insert(0, date.today().isoformat())
+        ctx['notes_entry'].delete(0, tk.END)
         
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f'+{x}+{y}')
+        self.show_dialog(ctx['dialog'], f"Log Progress - {category['name']}", 300, 200,
+                         ctx['minutes_entry'])
+        
+    def create_log_dialog(self):
+        """Build the widgets of the log progress dialog"""
+        dialog = self.create_dialog()
         
         # Form fields
         ttk.Label(dialog, text="Minutes spent:").pack(pady=(10, 5))
@@ -895,106 +1573,163 @@ class ConsistencyTracker:
         
         ttk.Label(dialog, text="Date:").pack(pady=5)
         date_entry = ttk.Entry(dialog, width=30)
-        date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
         date_entry.pack(pady=5)
         
         ttk.Label(dialog, text="Notes (optional):").pack(pady=5)
         notes_entry = ttk.Entry(dialog, width=30)
         notes_entry.pack(pady=5)
         
-        def save():
-            minutes = minutes_entry.get().strip()
-            date_str = date_entry.get().strip()
-            notes = notes_entry.get().strip()
-            
-            if not minutes:
-                messagebox.showerror("Error", "Please enter minutes spent")
-                return
-                
-            try:
-                minutes = int(minutes)
-                if minutes <= 0:
-                    raise ValueError
-            except:
-                messagebox.showerror("Error", "Please enter a valid positive number for minutes")
-                return
-                
-            # Validate date
-            try:
-                datetime.strptime(date_str, "%Y-%m-%d")
-            except:
-                messagebox.showerror("Error", "Please enter a valid date (YYYY-MM-DD)")
-                return
-                
-            # Create new log
-            new_log = {
-                'id': datetime.now().strftime('%Y%m%d%H%M%S'),
-                'category_id': category['id'],
-                'minutes': minutes,
-                'date': date_str,
-                'notes': notes
-            }
-            
-            self.logs.append(new_log)
-            self.save_data()
-            self.refresh_display()
-            
-            dialog.destroy()
-            
         # Buttons
         button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=20)
         
-        ttk.Button(button_frame, text="Save", command=save).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Save", command=self.save_log).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel",
+                   command=lambda: self.hide_dialog(dialog)).pack(side=tk.LEFT, padx=5)
+        dialog.bind('<Return>', lambda e: self.save_log())
+        
+        return {
+            'dialog': dialog,
+            'minutes_entry': minutes_entry,
+            'date_entry': date_entry,
+            'notes_entry': notes_entry,
+            'category': None
+        }
+        
+    def save_log(self):
+        """Validate the log dialog and record the progress"""
+        from tkinter import messagebox
+        ctx = self._log_dialog
+        category = ctx['category']
+        minutes = ctx['minutes_entry'].get().strip()
+        date_str = ctx['date_entry'].get().strip()
+        notes = ctx['notes_entry'].get().strip()
+        
+        if not minutes:
+            messagebox.showerror("Error", "Please enter minutes spent")
+            return
+            
+        try:
+            minutes = int(minutes)
+            if not 0 < minutes <= MAX_LOG_MINUTES:
+                raise ValueError
+        except (ValueError, TypeError):
+            messagebox.showerror("Error", f"Please enter a number of minutes from 1 to {MAX_LOG_MINUTES}")
+            return
+            
+        # Validate date: the regex pins the format, date() the calendar
+        match = _DATE_RE.fullmatch(date_str)
+        try:
+            if not match:
+                raise ValueError
+            log_date = date(*map(int, match.groups()))
+            if not MIN_LOG_YEAR <= log_date.year <= date.today().year + 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid date (YYYY-MM-DD)")
+            return
+            
+        # Create new log
+        new_log = {
+            'id': self.new_id(),
+            'category_id': category['id'],
+            'minutes': minutes,
+            'date': log_date.isoformat(),
+            'notes': notes,
+            '_date': log_date
+        }
+        
+        self.logs.append(new_log)
+        self._logs_by_cat[category['id']].append(new_log)
+        self._minutes_by_cat_date[category['id'], log_date.toordinal()] += minutes
+        self._append_log_arrays(new_log)
+        self._index_log(new_log)
+        self._append_log_record(_stored(new_log))
+        self._refresh_category(category['id'])
+        
+        self.hide_dialog(ctx['dialog'])
         
     def delete_category(self, category_id):
         """Delete a category and its logs"""
+        from tkinter import messagebox
         if messagebox.askyesno("Confirm Delete", 
                                "Are you sure you want to delete this category? All related logs will also be deleted."):
             # Remove category
-            self.categories = [c for c in self.categories if c['id'] != category_id]
+            self.categories.pop(category_id, None)
             
-            # Remove related logs
-            self.logs = [log for log in self.logs if log['category_id'] != category_id]
+            # Remove related logs; the flat list is only rebuilt when the
+            # category has any, matching by identity since ids can repeat
+            removed = self._logs_by_cat.pop(category_id, ())
+            for log in removed:
+                self._minutes_by_cat_date.pop((category_id, log['_date'].toordinal()), None)
+            if removed:
+                removed_logs = {id(log) for log in removed}
+                self.logs = [log for log in self.logs if id(log) not in removed_logs]
+            self._build_log_arrays()
             
-            self.save_data()
+            # The logs stay in the log file behind a tombstone until compaction
+            self._append_log_record({'op': 'del_cat', 'id': category_id})
+            self._garbage_lines += 1 + len(removed)
+            if self._garbage_lines > COMPACT_RATIO * len(self.logs):
+                self._compact()
+                
+            # Save right away, the tombstone is already queued
+            self._dirty = True
+            self._flush()
             self.refresh_display()
             
     def prev_month(self):
         """Go to previous month"""
-        if self.current_month == 1:
-            self.current_month = 12
-            self.current_year -= 1
-        else:
-            self.current_month -= 1
-        self.update_calendar()
+        self.shift_month(-1)
         
     def next_month(self):
         """Go to next month"""
-        if self.current_month == 12:
-            self.current_month = 1
-            self.current_year += 1
-        else:
-            self.current_month += 1
-        self.update_calendar()
+        self.shift_month(1)
+        
+    def shift_month(self, delta):
+        """Move the calendar by delta months and queue one repaint
+        
+        The repaint runs on the idle queue, so rapid clicks through
+        several months only redraw the grid once.
+        """
+        self.current_year, month = divmod(self.current_year * 12 + self.current_month - 1 + delta, 12)
+        self.current_month = month + 1
+        self.refresh_display({'calendar'})
 
     def manual_save(self):
         """Manually save progress and show confirmation"""
-        self.save_data()
+        from tkinter import messagebox
+        # Let queued writes finish so that any failure among them is known
+        self.wait_for_saves()
+        failed = self._write_errors != self._saved_errors
+        if not self._dirty and not failed:
+            messagebox.showinfo("Progress Saved", "Already up to date.")
+            return
+            
+        # After a failed write both files are rewritten from memory
+        if failed:
+            self._dirty = True
+            self._compact()
+        errors = self._write_errors
+        self._flush(wait=True, pretty=True)
+        if self._write_errors != errors:
+            messagebox.showerror("Error", "Your progress could not be saved. See the console for details.")
+            return
+        self._saved_errors = errors
         messagebox.showinfo("Progress Saved", "Your progress has been saved successfully!")
 
 def main():
     root = tk.Tk()
     app = ConsistencyTracker(root)
     
-    # Set window icon (optional)
-    try:
+    # Set window icon (optional, .ico files are only supported on Windows)
+    if sys.platform == 'win32' and os.path.exists('icon.ico'):
         root.iconbitmap(default='icon.ico')
-    except:
-        pass
         
     root.mainloop()
+    
+    # The writer thread is a daemon, let it finish pending saves
+    app.wait_for_saves()
 
 if __name__ == "__main__":
     main()  
\ No newline at end of file